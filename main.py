@@ -2,8 +2,7 @@ import argparse
 import sys
 
 from models import SpeedTestConfig
-from speed_tester import SpeedTester
-from utils import format_output, setup_logging, validate_config
+from utils import setup_logging, write_output
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -76,7 +75,7 @@ def main() -> int:
     logger = setup_logging(verbose=args.verbose)
 
     try:
-        # Create and validate configuration
+        # Create and validate configuration; risky values are logged as warnings
         config = SpeedTestConfig(
             url=args.url,
             download_size_mb=args.download_size,
@@ -86,10 +85,8 @@ def main() -> int:
             timeout_seconds=args.timeout,
         )
 
-        # Validate configuration
-        if not validate_config(config):
-            logger.error("Invalid configuration provided")
-            return 1
+        # Imported here so --help and argument errors don't load the HTTP stack
+        from speed_tester import SpeedTester
 
         # Create speed tester instance
         speed_tester = SpeedTester(config)
@@ -99,8 +96,7 @@ def main() -> int:
         result = speed_tester.run_all_tests()
 
         # Format and output results
-        output = format_output(result, output_format=args.output)
-        print(output)
+        write_output(result, sys.stdout, output_format=args.output)
 
         return 0
 
@@ -1,9 +1,21 @@
+import logging
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, conint, validator
+from exceptions import ConfigurationError
+
+_log = logging.getLogger("speedtest")
+
+# Exclusive upper bounds for the integer fields of SpeedTestConfig
+_CONFIG_LIMITS = (
+    ("download_size_mb", 1000),
+    ("upload_size_mb", 1000),
+    ("ping_count", 100),
+    ("jitter_samples", 100),
+    ("timeout_seconds", 300),
+)
 
 
 class OutputFormat(Enum):
@@ -16,37 +28,58 @@ class OutputFormat(Enum):
     CSV = auto()
 
 
-class SpeedTestConfig(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SpeedTestConfig:
     """
     Configuration for speed tests.
     """
 
-    url: str = Field(..., description="URL of the speed test server")
-    download_size_mb: conint(gt=0, lt=1000) = Field(
-        10, description="Size of download test in MB"
-    )
-    upload_size_mb: conint(gt=0, lt=1000) = Field(
-        5, description="Size of upload test in MB"
-    )
-    ping_count: conint(gt=0, lt=100) = Field(
-        10, description="Number of ping measurements"
-    )
-    jitter_samples: conint(gt=0, lt=100) = Field(
-        20, description="Number of samples for jitter measurement"
-    )
-    timeout_seconds: conint(gt=0, lt=300) = Field(
-        30, description="Timeout for network operations in seconds"
-    )
-
-    @validator("url")
-    def validate_url(cls, v):
-        """
-        Validate that the URL uses HTTPS.
+    url: str  # URL of the speed test server
+    download_size_mb: int = 10  # Size of download test in MB
+    upload_size_mb: int = 5  # Size of upload test in MB
+    ping_count: int = 10  # Number of ping measurements
+    jitter_samples: int = 20  # Number of samples for jitter measurement
+    timeout_seconds: int = 30  # Timeout for network operations in seconds
+
+    def __post_init__(self):
         """
-        if not v.startswith("https://"):
-            raise ValueError("URL must use HTTPS for security")
+        Validate the configuration values and warn about risky ones.
 
-        return v
+        Raises:
+            ConfigurationError: If a value is not an integer, is out of range,
+                or the URL is not HTTPS
+        """
+        if not self.url.startswith("https://"):
+            raise ConfigurationError("URL must use HTTPS for security")
+
+        for name, upper in _CONFIG_LIMITS:
+            value = getattr(self, name)
+            # bool is a subclass of int but is never a valid size or count
+            if not isinstance(value, int) or isinstance(value, bool):
+                raise ConfigurationError(
+                    f"{name} must be an integer, got {type(value).__name__} {value!r}"
+                )
+            if not 0 < value < upper:
+                raise ConfigurationError(
+                    f"{name} must be greater than 0 and less than {upper}, got {value}"
+                )
+
+        # Valid but risky values only produce warnings; the messages use lazy
+        # %-style arguments so nothing is formatted when warnings are filtered
+        if self.download_size_mb > 100:
+            _log.warning(
+                "Large download size (%s MB) may cause timeouts", self.download_size_mb
+            )
+
+        if self.upload_size_mb > 50:
+            _log.warning(
+                "Large upload size (%s MB) may cause timeouts", self.upload_size_mb
+            )
+
+        if self.timeout_seconds < 5:
+            _log.warning(
+                "Timeout is very short and may cause tests to fail prematurely"
+            )
 
 
 @dataclass
@@ -129,46 +162,56 @@ class SpeedTestResult:
         """
         return any([self.ping, self.jitter, self.download, self.upload])
 
-    @property
-    def to_dict(self) -> Dict[str, Any]:
+    def as_dict(self, ndigits: Optional[int] = None) -> Dict[str, Any]:
         """
         Convert the result to a dictionary for serialization.
+
+        Args:
+            ndigits (Optional[int]): Decimal places to round floats to while
+                building the dictionary; values are left unrounded if None
+
+        Returns:
+            Dict[str, Any]: Serializable representation of the result
         """
+
+        def num(value: float) -> float:
+            return value if ndigits is None else round(value, ndigits)
+
         result = {"timestamp": self.formatted_timestamp, "errors": self.errors}
 
         if self.ping:
             result["ping"] = {
-                "min_ms": round(self.ping.min_ms, 2),
-                "max_ms": round(self.ping.max_ms, 2),
-                "avg_ms": round(self.ping.avg_ms, 2),
+                "min_ms": num(self.ping.min_ms),
+                "max_ms": num(self.ping.max_ms),
+                "avg_ms": num(self.ping.avg_ms),
                 "samples": self.ping.samples,
                 "failed": self.ping.failed,
-                "success_rate_percent": round(self.ping.success_rate_percent, 2),
+                "success_rate_percent": num(self.ping.success_rate_percent),
             }
 
         if self.jitter:
             result["jitter"] = {
-                "min_ms": round(self.jitter.min_jitter_ms, 2),
-                "max_ms": round(self.jitter.max_jitter_ms, 2),
-                "avg_ms": round(self.jitter.avg_jitter_ms, 2),
+                "min_ms": num(self.jitter.min_jitter_ms),
+                "max_ms": num(self.jitter.max_jitter_ms),
+                "avg_ms": num(self.jitter.avg_jitter_ms),
                 "samples": self.jitter.samples,
                 "failed": self.jitter.failed,
-                "success_rate_percent": round(self.jitter.success_rate_percent, 2),
+                "success_rate_percent": num(self.jitter.success_rate_percent),
             }
 
         if self.download:
             result["download"] = {
-                "speed_mbps": round(self.download.speed_mbps, 2),
+                "speed_mbps": num(self.download.speed_mbps),
                 "bytes": self.download.bytes_transferred,
-                "time_seconds": round(self.download.time_seconds, 2),
+                "time_seconds": num(self.download.time_seconds),
                 "size_mb": self.download.requested_size_mb,
             }
 
         if self.upload:
             result["upload"] = {
-                "speed_mbps": round(self.upload.speed_mbps, 2),
+                "speed_mbps": num(self.upload.speed_mbps),
                 "bytes": self.upload.bytes_transferred,
-                "time_seconds": round(self.upload.time_seconds, 2),
+                "time_seconds": num(self.upload.time_seconds),
                 "size_mb": self.upload.requested_size_mb,
             }
 
@@ -1,11 +1,21 @@
+import itertools
 import logging
-import secrets
+import math
+import os
+import socket
 import statistics
 import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.utils import get_environ_proxies, select_proxy
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.exceptions import ReadTimeoutError
 
 from exceptions import InvalidResponseError, NetworkConnectionError, TestTimeoutError
 from models import (
@@ -17,12 +27,258 @@ from models import (
     UploadResult,
 )
 
+# Connection pool sizing for the shared session; all tests talk to one host
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 4
+
+NODELAY_OPTION = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+# Largest upload sent as a single in-memory buffer
+UPLOAD_BUFFER_LIMIT = 64 * 1024 * 1024
+
+# Cache buster for latency probes; seeded once so values stay unique across runs
+_cache_buster = itertools.count(int(time.time() * 1000))
+
+
+class NoDelayAdapter(HTTPAdapter):
+    """HTTP adapter that disables Nagle's algorithm on every pooled socket."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the pool manager with TCP_NODELAY in the socket options.
+
+        Args:
+            *args: Positional arguments passed to HTTPAdapter.init_poolmanager
+            **kwargs: Keyword arguments passed to HTTPAdapter.init_poolmanager
+        """
+        socket_options = list(
+            kwargs.get("socket_options", HTTPConnection.default_socket_options)
+        )
+        if NODELAY_OPTION not in socket_options:
+            socket_options.append(NODELAY_OPTION)
+
+        kwargs["socket_options"] = socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class PinnedHostAdapter(NoDelayAdapter):
+    """
+    HTTP adapter that connects to a pre-resolved address for a single host.
+
+    The request URL is rewritten to the cached IP address while the Host
+    header, TLS SNI and certificate checks keep using the original hostname.
+    """
+
+    def __init__(self, host: str, address: str, **kwargs: Any):
+        """
+        Initialize the adapter.
+
+        Args:
+            host (str): Hostname the requests are addressed to
+            address (str): Resolved IP address to connect to instead
+            **kwargs: Keyword arguments passed to HTTPAdapter
+        """
+        self.host = host
+        self.address = address
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Initialize the pool manager with SNI set to the original hostname.
+
+        Args:
+            *args: Positional arguments passed to HTTPAdapter.init_poolmanager
+            **kwargs: Keyword arguments passed to HTTPAdapter.init_poolmanager
+        """
+        kwargs["server_hostname"] = self.host
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send the request to the pinned address.
+
+        Args:
+            request (requests.PreparedRequest): Request to send
+            **kwargs: Keyword arguments passed to HTTPAdapter.send
+
+        Returns:
+            requests.Response: Response with the original request attached
+
+        Raises:
+            requests.exceptions.RequestException: If the request fails, with
+                the hostname in place of the pinned address in the message
+        """
+        parsed = urlparse(request.url)
+        address = f"[{self.address}]" if ":" in self.address else self.address
+        if parsed.port:
+            address = f"{address}:{parsed.port}"
+
+        pinned = request.copy()
+        pinned.url = parsed._replace(netloc=address).geturl()
+        pinned.headers["Host"] = parsed.netloc
+
+        try:
+            response = super().send(pinned, **kwargs)
+        except requests.exceptions.RequestException as e:
+            # urllib3 names the pool after the address it connected to; report
+            # the hostname instead so errors read the same as without pinning
+            message = str(e).replace(f"host='{self.address}'", f"host='{self.host}'")
+            raise type(e)(message, request=request) from e
+
+        response.request = request
+        response.url = request.url
+
+        return response
+
+
+def resolve_host(url: str, timeout: float) -> Optional[Tuple[str, str]]:
+    """
+    Resolve the host of a URL once and pick an address that accepts connections.
+
+    Addresses are tried in getaddrinfo order, the same fallback urllib3 does
+    on every connection, so a host whose first record is unreachable (e.g.
+    an AAAA record without a working IPv6 route) is pinned to one that works.
+
+    Args:
+        url (str): URL whose host should be resolved
+        timeout (float): Connect timeout in seconds for each address tried
+
+    Returns:
+        Optional[Tuple[str, str]]: (hostname, address) pair, or None if the
+            host can't be resolved or none of its addresses accept connections
+    """
+    try:
+        parsed = urlparse(url)
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    except ValueError:
+        # Malformed URLs (bad port, unclosed IPv6 bracket) are left for the
+        # tests to report through requests
+        return None
+
+    try:
+        addresses = socket.getaddrinfo(parsed.hostname, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError):
+        return None
+
+    for family, socktype, proto, _, sockaddr in addresses:
+        try:
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(timeout)
+                sock.connect(sockaddr)
+        except OSError:
+            continue
+
+        return parsed.hostname, sockaddr[0]
+
+    return None
+
+
+def uses_proxy(url: str, session: requests.Session) -> bool:
+    """
+    Check whether requests would send a URL through a proxy.
+
+    Args:
+        url (str): URL that will be requested
+        session (requests.Session): Session the request would be sent with
+
+    Returns:
+        bool: True if a proxy from the session or the environment applies
+    """
+    try:
+        proxies = get_environ_proxies(url) if session.trust_env else {}
+        proxies.update(session.proxies)
+        return select_proxy(url, proxies) is not None
+    except ValueError:
+        return False
+
+
+def create_session() -> requests.Session:
+    """
+    Create an HTTP session with a pooled, keep-alive connection adapter.
+
+    Returns:
+        requests.Session: Session to be shared across all tests
+    """
+    session = requests.Session()
+    # Every request must reach the server, so disable caching session-wide
+    session.headers.update({"Cache-Control": "no-cache"})
+    adapter = NoDelayAdapter(
+        pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=0
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def open_connection(
+    session: requests.Session, config: SpeedTestConfig, logger: logging.Logger
+) -> None:
+    """
+    Send a HEAD request so a pooled connection is set up before measuring.
+
+    Args:
+        session (requests.Session): Session whose pool should hold the connection
+        config (SpeedTestConfig): Configuration with the server URL and timeout
+        logger (logging.Logger): Logger for reporting a failed warm-up
+    """
+    try:
+        session.head(
+            config.url,
+            timeout=min(5, config.timeout_seconds),
+            headers={"Accept-Encoding": "identity"},
+        )
+    except requests.exceptions.RequestException as e:
+        logger.debug(f"Connection warm-up failed: {e}")
+
+
+class RepeatingBody:
+    """Request body that repeats one chunk of data up to a fixed size."""
+
+    def __init__(self, chunk: bytes, size: int):
+        """
+        Initialize the body.
+
+        Args:
+            chunk (bytes): Data to send repeatedly
+            size (int): Total number of bytes to send
+        """
+        self.chunk = chunk
+        self.size = size
+
+    def __len__(self) -> int:
+        """
+        Return the total body size, letting requests send a Content-Length.
+
+        Returns:
+            int: Total number of bytes in the body
+        """
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """
+        Yield the chunk until the total size is reached.
+
+        Returns:
+            Iterator[bytes]: Chunks of the body
+        """
+        remaining_bytes = self.size
+        while remaining_bytes > 0:
+            current_chunk_size = min(len(self.chunk), remaining_bytes)
+            remaining_bytes -= current_chunk_size
+            yield self.chunk[:current_chunk_size]
+
 
 class BaseTest(ABC):
     """Abstract base class for all network performance tests."""
 
     def __init__(
-        self, config: SpeedTestConfig, logger: Optional[logging.Logger] = None
+        self,
+        config: SpeedTestConfig,
+        logger: Optional[logging.Logger] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the base test.
@@ -30,9 +286,12 @@ class BaseTest(ABC):
         Args:
             config (SpeedTestConfig): Configuration parameters for the test
             logger (Optional[logging.Logger]): Logger instance for logging
+            session (Optional[requests.Session]): Shared HTTP session to reuse
+                pooled connections across tests
         """
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
+        self.session = session or create_session()
 
     @abstractmethod
     def run_test(self) -> Any:
@@ -44,6 +303,166 @@ class BaseTest(ABC):
         """
         pass
 
+    def _probe(self, label: str, i: int, total: int) -> Optional[float]:
+        """
+        Send a single latency probe and measure its round-trip time.
+
+        Args:
+            label (str): Name of the test, used in log messages
+            i (int): Zero-based index of the probe
+            total (int): Total number of probes in the test
+
+        Returns:
+            Optional[float]: Round-trip time in ms, or None if the probe failed
+        """
+        try:
+            # The body is streamed so the timer stops once the response headers
+            # arrive: the measurement brackets one request/response round trip
+            # and excludes reading the body
+            start_time = time.perf_counter()
+            response = self.session.get(
+                self.config.url,
+                timeout=self.config.timeout_seconds,
+                # An empty body keeps the probe to a single round trip
+                params={"bytes": 0, "_": next(_cache_buster)},
+                stream=True,
+            )
+            end_time = time.perf_counter()
+
+            # Drain the (empty) body so the connection goes back to the pool
+            response.raw.drain_conn()
+            response.close()
+
+            if response.status_code == 200:
+                ping_time = (end_time - start_time) * 1000  # Convert to ms
+                self.logger.debug(f"{label} {i + 1}/{total}: {ping_time:.2f} ms")
+                return ping_time
+
+            self.logger.warning(
+                f"{label} request {i + 1} failed with status code: {response.status_code}"
+            )
+
+        except requests.exceptions.Timeout:
+            self.logger.warning(f"{label} request {i + 1} timed out")
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"{label} request {i + 1} failed: {e}")
+
+        return None
+
+    def _probe_sequentially(self, label: str, total: int) -> List[Optional[float]]:
+        """
+        Send latency probes one after another.
+
+        Args:
+            label (str): Name of the test, used in log messages
+            total (int): Number of probes to send
+
+        Returns:
+            List[Optional[float]]: Round-trip times in ms in probe order, with
+                None for failed probes
+        """
+        samples: List[Optional[float]] = [None] * total
+
+        for i in range(total):
+            samples[i] = self._probe(label, i, total)
+
+            # Small delay between pings to avoid overwhelming the server
+            if i < total - 1:
+                time.sleep(0.2)
+
+        return samples
+
+
+def _ping_result(samples: List[Optional[float]]) -> PingResult:
+    """
+    Summarize latency probes as ping statistics.
+
+    Args:
+        samples (List[Optional[float]]): Round-trip times in ms, None for failures
+
+    Returns:
+        PingResult: Ping statistics
+
+    Raises:
+        NetworkConnectionError: If all probes failed
+    """
+    ping_times = [sample for sample in samples if sample is not None]
+
+    # Calculate statistics if we have any successful pings
+    if not ping_times:
+        raise NetworkConnectionError("All ping requests failed")
+
+    return PingResult(
+        min_ms=min(ping_times),
+        max_ms=max(ping_times),
+        avg_ms=statistics.fmean(ping_times),
+        samples=len(ping_times),
+        failed=len(samples) - len(ping_times),
+        success_rate_percent=(len(ping_times) / len(samples)) * 100,
+    )
+
+
+def _jitter_result(samples: List[Optional[float]]) -> JitterResult:
+    """
+    Summarize consecutive latency probes as jitter statistics.
+
+    Args:
+        samples (List[Optional[float]]): Round-trip times in ms in probe order,
+            None for failures
+
+    Returns:
+        JitterResult: Jitter statistics
+
+    Raises:
+        NetworkConnectionError: If fewer than two probes succeeded
+    """
+    ping_times = [sample for sample in samples if sample is not None]
+
+    # Calculate jitter if we have at least two successful pings
+    if len(ping_times) < 2:
+        raise NetworkConnectionError(
+            "Not enough successful jitter samples to calculate result"
+        )
+
+    # Accumulate count, sum, sum of squares and extremes of the
+    # differences between consecutive ping times in a single pass
+    count = 0
+    total = 0.0
+    total_sq = 0.0
+    min_jitter = math.inf
+    max_jitter = -math.inf
+
+    previous = ping_times[0]
+    for current in ping_times[1:]:
+        difference = abs(current - previous)
+        previous = current
+
+        count += 1
+        total += difference
+        total_sq += difference * difference
+        if difference < min_jitter:
+            min_jitter = difference
+        if difference > max_jitter:
+            max_jitter = difference
+
+    jitter = total / count
+    std_dev = (
+        math.sqrt(max(total_sq - total * total / count, 0.0) / (count - 1))
+        if count > 1
+        else 0
+    )
+
+    return JitterResult(
+        avg_jitter_ms=jitter,
+        min_jitter_ms=min_jitter,
+        max_jitter_ms=max_jitter,
+        std_dev_ms=std_dev,
+        samples=len(ping_times),
+        failed=len(samples) - len(ping_times),
+        success_rate_percent=(len(ping_times) / len(samples)) * 100,
+    )
+
 
 class PingTest(BaseTest):
     """Test for measuring network latency (ping)."""
@@ -61,66 +480,54 @@ class PingTest(BaseTest):
         """
         self.logger.info(f"Starting ping test ({self.config.ping_count} samples)...")
 
-        ping_times: List[float] = []
-        failed_pings = 0
-
-        for i in range(self.config.ping_count):
-            try:
-                start_time = time.time()
-                response = requests.get(
-                    self.config.url,
-                    timeout=self.config.timeout_seconds,
-                    headers={"Cache-Control": "no-cache"},
-                    params={"_": int(time.time() * 1000)},  # Cache buster
+        # Pre-size the sample list; probes fill it by index as they complete
+        samples: List[Optional[float]] = [None] * self.config.ping_count
+
+        # Probes are independent, so dispatch them concurrently; the worker
+        # count is capped by the session's pool so connections get reused
+        max_workers = min(self.config.ping_count, POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Open one connection per worker first, concurrently so each gets
+            # its own, keeping TCP and TLS handshakes out of the samples
+            warm_ups = [
+                executor.submit(
+                    open_connection, self.session, self.config, self.logger
                 )
-                end_time = time.time()
-
-                if response.status_code == 200:
-                    ping_time = (end_time - start_time) * 1000  # Convert to ms
-                    ping_times.append(ping_time)
-                    self.logger.debug(
-                        f"Ping {i + 1}/{self.config.ping_count}: {ping_time:.2f} ms"
-                    )
-                else:
-                    self.logger.warning(
-                        f"Ping request {i + 1} failed with status code: {response.status_code}"
-                    )
-                    failed_pings += 1
-
-            except requests.exceptions.Timeout:
-                self.logger.warning(f"Ping request {i + 1} timed out")
-                failed_pings += 1
-
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Ping request {i + 1} failed: {e}")
-                failed_pings += 1
+                for _ in range(max_workers)
+            ]
+            for future in warm_ups:
+                future.result()
 
-            # Small delay between pings to avoid overwhelming the server
-            if i < self.config.ping_count - 1:
-                time.sleep(0.2)
+            futures = {
+                executor.submit(self._one_ping, i): i
+                for i in range(self.config.ping_count)
+            }
 
-        # Calculate statistics if we have any successful pings
-        if ping_times:
-            min_ping = min(ping_times)
-            max_ping = max(ping_times)
-            avg_ping = statistics.mean(ping_times)
+            for future in as_completed(futures):
+                samples[futures[future]] = future.result()
 
-            success_rate = (len(ping_times) / self.config.ping_count) * 100
+        result = _ping_result(samples)
 
-            self.logger.info(
-                f"Ping test completed: min={min_ping:.2f}ms, avg={avg_ping:.2f}ms, max={max_ping:.2f}ms"
-            )
+        self.logger.info(
+            f"Ping test completed: min={result.min_ms:.2f}ms, avg={result.avg_ms:.2f}ms, max={result.max_ms:.2f}ms"
+        )
 
-            return PingResult(
-                min_ms=min_ping,
-                max_ms=max_ping,
-                avg_ms=avg_ping,
-                samples=len(ping_times),
-                failed=failed_pings,
-                success_rate_percent=success_rate,
-            )
-        else:
-            raise NetworkConnectionError("All ping requests failed")
+        return result
+
+    def _one_ping(self, i: int) -> Optional[float]:
+        """
+        Send a single ping probe and measure its round-trip time.
+
+        Args:
+            i (int): Zero-based index of the probe
+
+        Returns:
+            Optional[float]: Round-trip time in ms, or None if the probe failed
+        """
+        # Stagger probes slightly so they don't hit the server in one burst
+        time.sleep(i * 0.01)
+
+        return self._probe("Ping", i, self.config.ping_count)
 
 
 class JitterTest(BaseTest):
@@ -141,74 +548,91 @@ class JitterTest(BaseTest):
             f"Starting jitter test ({self.config.jitter_samples} samples)..."
         )
 
-        ping_times: List[float] = []
-        failed_pings = 0
+        # Jitter measures variation between consecutive samples, so the
+        # probes must be sent one after another
+        samples = self._probe_sequentially("Jitter", self.config.jitter_samples)
+        result = _jitter_result(samples)
 
-        for i in range(self.config.jitter_samples):
-            try:
-                start_time = time.time()
-                response = requests.get(
-                    self.config.url,
-                    timeout=self.config.timeout_seconds,
-                    headers={"Cache-Control": "no-cache"},
-                    params={"_": int(time.time() * 1000)},  # Cache buster
-                )
-                end_time = time.time()
-
-                if response.status_code == 200:
-                    ping_time = (end_time - start_time) * 1000  # Convert to ms
-                    ping_times.append(ping_time)
-                    self.logger.debug(
-                        f"Jitter sample {i + 1}/{self.config.jitter_samples}: {ping_time:.2f} ms"
-                    )
-                else:
-                    self.logger.warning(
-                        f"Jitter request {i + 1} failed with status code: {response.status_code}"
-                    )
-                    failed_pings += 1
-
-            except requests.exceptions.Timeout:
-                self.logger.warning(f"Jitter request {i + 1} timed out")
-                failed_pings += 1
-
-            except requests.exceptions.RequestException as e:
-                self.logger.error(f"Jitter request {i + 1} failed: {e}")
-                failed_pings += 1
+        self.logger.info(
+            f"Jitter test completed: {result.avg_jitter_ms:.2f}ms avg jitter"
+        )
 
-            # Small delay between pings to avoid overwhelming the server
-            if i < self.config.jitter_samples - 1:
-                time.sleep(0.2)
+        return result
 
-        # Calculate jitter if we have at least two successful pings
-        if len(ping_times) >= 2:
-            # Calculate differences between consecutive ping times
-            differences = [
-                abs(ping_times[i] - ping_times[i - 1])
-                for i in range(1, len(ping_times))
-            ]
 
-            jitter = statistics.mean(differences)
-            max_jitter = max(differences)
-            min_jitter = min(differences)
-            std_dev = statistics.stdev(differences) if len(differences) > 1 else 0
+class LatencyTest(BaseTest):
+    """Test measuring ping and jitter from a single sweep of latency probes."""
 
-            success_rate = (len(ping_times) / self.config.jitter_samples) * 100
+    def run_test(self) -> Tuple[PingResult, JitterResult]:
+        """
+        Run one sequential sweep and derive both ping and jitter results.
 
-            self.logger.info(f"Jitter test completed: {jitter:.2f}ms avg jitter")
+        Returns:
+            Tuple[PingResult, JitterResult]: Results of the ping and jitter tests
 
-            return JitterResult(
-                avg_jitter_ms=jitter,
-                min_jitter_ms=min_jitter,
-                max_jitter_ms=max_jitter,
-                std_dev_ms=std_dev,
-                samples=len(ping_times),
-                failed=failed_pings,
-                success_rate_percent=success_rate,
-            )
-        else:
-            raise NetworkConnectionError(
-                "Not enough successful jitter samples to calculate result"
-            )
+        Raises:
+            NetworkConnectionError: If there's an issue connecting to the server
+            TestTimeoutError: If the test times out
+        """
+        samples = self.collect_samples()
+
+        return self.ping_result(samples), self.jitter_result(samples)
+
+    def collect_samples(self) -> List[Optional[float]]:
+        """
+        Send enough sequential probes to cover both ping and jitter.
+
+        Returns:
+            List[Optional[float]]: Round-trip times in ms in probe order, with
+                None for failed probes
+        """
+        total = max(self.config.ping_count, self.config.jitter_samples)
+
+        self.logger.info(f"Starting latency test ({total} samples)...")
+
+        return self._probe_sequentially("Latency", total)
+
+    def ping_result(self, samples: List[Optional[float]]) -> PingResult:
+        """
+        Compute ping statistics from the first ping_count samples.
+
+        Args:
+            samples (List[Optional[float]]): Samples from collect_samples
+
+        Returns:
+            PingResult: Results of the ping test
+
+        Raises:
+            NetworkConnectionError: If all ping probes failed
+        """
+        result = _ping_result(samples[: self.config.ping_count])
+
+        self.logger.info(
+            f"Ping test completed: min={result.min_ms:.2f}ms, avg={result.avg_ms:.2f}ms, max={result.max_ms:.2f}ms"
+        )
+
+        return result
+
+    def jitter_result(self, samples: List[Optional[float]]) -> JitterResult:
+        """
+        Compute jitter statistics from the first jitter_samples samples.
+
+        Args:
+            samples (List[Optional[float]]): Samples from collect_samples
+
+        Returns:
+            JitterResult: Results of the jitter test
+
+        Raises:
+            NetworkConnectionError: If fewer than two probes succeeded
+        """
+        result = _jitter_result(samples[: self.config.jitter_samples])
+
+        self.logger.info(
+            f"Jitter test completed: {result.avg_jitter_ms:.2f}ms avg jitter"
+        )
+
+        return result
 
 
 class DownloadTest(BaseTest):
@@ -233,15 +657,19 @@ class DownloadTest(BaseTest):
             f"Starting download test ({self.config.download_size_mb} MB)..."
         )
 
+        # Read the content in large chunks into a reusable buffer to keep the
+        # number of Python-level iterations low on fast connections
+        buffer = bytearray(256 * 1024)
+
         try:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Stream the response to handle large downloads efficiently
-            response = requests.get(
+            response = self.session.get(
                 url,
                 timeout=self.config.timeout_seconds,
                 stream=True,
-                headers={"Cache-Control": "no-cache"},
+                headers={"Accept-Encoding": "identity"},
             )
 
             if response.status_code != 200:
@@ -249,15 +677,24 @@ class DownloadTest(BaseTest):
                     f"Download test failed with status code: {response.status_code}"
                 )
 
-            # Read the content in chunks to avoid memory issues
-            chunk_size = 8192
+            # Read the raw body; with identity encoding this counts wire bytes
+            raw = response.raw
             downloaded_bytes = 0
 
-            for chunk in response.iter_content(chunk_size=chunk_size):
-                if chunk:
-                    downloaded_bytes += len(chunk)
-
-            end_time = time.time()
+            # Reading the raw stream bypasses the exception mapping requests
+            # applies in iter_content, so translate urllib3 errors here
+            try:
+                while True:
+                    bytes_read = raw.readinto(buffer)
+                    if not bytes_read:
+                        break
+                    downloaded_bytes += bytes_read
+            except ReadTimeoutError:
+                raise TestTimeoutError("Download test timed out")
+            except URLLib3HTTPError as e:
+                raise NetworkConnectionError(f"Download test failed: {e}")
+
+            end_time = time.perf_counter()
             duration = end_time - start_time
 
             # Calculate the speed in Mbps (megabits per second)
@@ -301,42 +738,34 @@ class UploadTest(BaseTest):
         size_bytes = self.config.upload_size_mb * 1024 * 1024
 
         # Generate random data for upload
-        # Using secrets for cryptographically strong random data
         self.logger.info(
             f"Generating {self.config.upload_size_mb} MB of data for upload test..."
         )
 
-        # Generate data in chunks to avoid memory issues with large uploads
-        chunk_size = min(1024 * 1024, size_bytes)  # 1 MB chunks or smaller
-        remaining_bytes = size_bytes
+        # The server discards the payload, so random bytes are generated once
+        # up front. Small uploads are sent as a single buffer; larger ones
+        # repeat a 1 MB chunk to avoid holding the whole payload in memory.
+        # Either way the body has a known length, so it is sent with
+        # Content-Length rather than chunked transfer encoding.
+        if size_bytes <= UPLOAD_BUFFER_LIMIT:
+            payload = os.urandom(size_bytes)
+        else:
+            payload = RepeatingBody(os.urandom(1024 * 1024), size_bytes)
 
         self.logger.info(f"Starting upload test ({self.config.upload_size_mb} MB)...")
 
         try:
-            start_time = time.time()
-
-            with requests.Session() as session:
-                # Function to generate chunks of random data
-                def data_generator():
-                    nonlocal remaining_bytes
-                    while remaining_bytes > 0:
-                        current_chunk_size = min(chunk_size, remaining_bytes)
-                        chunk = secrets.token_bytes(current_chunk_size)
-                        remaining_bytes -= current_chunk_size
-                        yield chunk
-
-                # Use POST to upload the data
-                response = session.post(
-                    self.config.url,
-                    data=data_generator(),
-                    timeout=self.config.timeout_seconds,
-                    headers={
-                        "Content-Type": "application/octet-stream",
-                        "Cache-Control": "no-cache",
-                    },
-                )
+            start_time = time.perf_counter()
 
-            end_time = time.time()
+            # Use POST to upload the data
+            response = self.session.post(
+                self.config.url,
+                data=payload,
+                timeout=self.config.timeout_seconds,
+                headers={"Content-Type": "application/octet-stream"},
+            )
+
+            end_time = time.perf_counter()
             duration = end_time - start_time
 
             if response.status_code not in (200, 201, 202, 204):
@@ -379,6 +808,40 @@ class SpeedTester:
         """
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.session = create_session()
+
+        # Resolve the test host once so DNS lookups don't skew the measurements.
+        # A proxy connects to the server itself, so pinning is skipped there:
+        # the proxy must be asked for the hostname, not a local address.
+        if uses_proxy(config.url, self.session):
+            self.logger.debug(f"Proxy configured for {config.url}; not pinning")
+            return
+
+        resolved = resolve_host(config.url, min(5, config.timeout_seconds))
+        if resolved:
+            host, address = resolved
+            self.logger.debug(f"Resolved {host} to {address}")
+            parsed = urlparse(config.url)
+            self.session.mount(
+                f"{parsed.scheme}://{parsed.netloc}/",
+                PinnedHostAdapter(
+                    host,
+                    address,
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=0,
+                ),
+            )
+        else:
+            self.logger.warning(
+                f"Could not resolve a reachable address for {config.url}"
+            )
+
+    def warm_up(self) -> None:
+        """
+        Open the pooled connection so the TLS handshake isn't measured by tests.
+        """
+        open_connection(self.session, self.config, self.logger)
 
     def run_ping_test(self) -> PingResult:
         """
@@ -387,7 +850,7 @@ class SpeedTester:
         Returns:
             PingResult: Results of the ping test
         """
-        test = PingTest(self.config, self.logger)
+        test = PingTest(self.config, self.logger, self.session)
         return test.run_test()
 
     def run_jitter_test(self) -> JitterResult:
@@ -397,7 +860,7 @@ class SpeedTester:
         Returns:
             JitterResult: Results of the jitter test
         """
-        test = JitterTest(self.config, self.logger)
+        test = JitterTest(self.config, self.logger, self.session)
         return test.run_test()
 
     def run_download_test(self) -> DownloadResult:
@@ -407,7 +870,7 @@ class SpeedTester:
         Returns:
             DownloadResult: Results of the download test
         """
-        test = DownloadTest(self.config, self.logger)
+        test = DownloadTest(self.config, self.logger, self.session)
         return test.run_test()
 
     def run_upload_test(self) -> UploadResult:
@@ -417,7 +880,7 @@ class SpeedTester:
         Returns:
             UploadResult: Results of the upload test
         """
-        test = UploadTest(self.config, self.logger)
+        test = UploadTest(self.config, self.logger, self.session)
         return test.run_test()
 
     def run_all_tests(self) -> SpeedTestResult:
@@ -429,18 +892,32 @@ class SpeedTester:
         """
         result = SpeedTestResult()
 
-        # Run tests in sequence to avoid interference
-        try:
-            result.ping = self.run_ping_test()
-        except Exception as e:
-            self.logger.error(f"Ping test failed: {e}")
-            result.errors.append(f"Ping test error: {str(e)}")
+        # Establish the connection up front so the handshake isn't measured
+        self.warm_up()
+
+        # Run tests in sequence to avoid interference. Ping and jitter are
+        # derived from one sweep of probes, each reporting its own errors.
+        latency_test = LatencyTest(self.config, self.logger, self.session)
 
         try:
-            result.jitter = self.run_jitter_test()
+            samples = latency_test.collect_samples()
         except Exception as e:
-            self.logger.error(f"Jitter test failed: {e}")
+            # Without samples neither result can be computed; report both
+            self.logger.error(f"Latency test failed: {e}")
+            result.errors.append(f"Ping test error: {str(e)}")
             result.errors.append(f"Jitter test error: {str(e)}")
+        else:
+            try:
+                result.ping = latency_test.ping_result(samples)
+            except Exception as e:
+                self.logger.error(f"Ping test failed: {e}")
+                result.errors.append(f"Ping test error: {str(e)}")
+
+            try:
+                result.jitter = latency_test.jitter_result(samples)
+            except Exception as e:
+                self.logger.error(f"Jitter test failed: {e}")
+                result.errors.append(f"Jitter test error: {str(e)}")
 
         try:
             result.download = self.run_download_test()
@@ -1,9 +1,45 @@
-import csv
-import io
 import json
 import logging
+import os
+import re
+from typing import Any, Iterator, Optional, TextIO
 
-from models import SpeedTestConfig, SpeedTestResult
+from models import SpeedTestResult
+
+# orjson is optional; bind the serializer once so lookups happen at import time
+try:
+    from orjson import OPT_INDENT_2
+    from orjson import dumps as _orjson_dumps
+
+    def _json_dumps(data: Any) -> str:
+        return _orjson_dumps(data, option=OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _json_dumps(data: Any) -> str:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+# Bytes per megabyte, and its reciprocal for converting byte counts
+_MB = 1 << 20
+_PER_MB = 1.0 / _MB
+
+# Constant CSV rows, built once instead of on every format call
+_CSV_PING_HEADER = "PING (ms),Min,Avg,Max,Samples,Failed,Success Rate (%)"
+_CSV_JITTER_HEADER = "JITTER (ms),Avg,Min,Max,Std Dev,Samples,Failed,Success Rate (%)"
+_CSV_DOWNLOAD_HEADER = "DOWNLOAD,Speed (Mbps),Transferred (MB),Time (s)"
+_CSV_UPLOAD_HEADER = "UPLOAD,Speed (Mbps),Transferred (MB),Time (s)"
+_CSV_ERRORS_HEADER = "ERRORS"
+
+# Library loggers silenced unless running in verbose mode
+_NOISY_LOGGERS = tuple(logging.getLogger(name) for name in ("urllib3", "requests"))
+
+# Logger returned by setup_logging and the level it was configured with
+_logger: Optional[logging.Logger] = None
+_log_level: Optional[int] = None
+
+# Characters that force a CSV field to be quoted
+_needs_quote = re.compile(r'[,"\r\n]').search
 
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
@@ -16,8 +52,14 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _logger, _log_level
+
     log_level = logging.DEBUG if verbose else logging.INFO
 
+    # Nothing to do if logging was already set up at this level
+    if _logger is not None and _log_level == log_level:
+        return _logger
+
     # Configure root logger
     logging.basicConfig(
         level=log_level,
@@ -26,42 +68,15 @@ def setup_logging(verbose: bool = False) -> logging.Logger:
     )
 
     # Get logger for this module
-    logger = logging.getLogger("speedtest")
+    _logger = logging.getLogger("speedtest")
+    _log_level = log_level
 
     # Add handler to suppress library logging unless in verbose mode
     if not verbose:
-        for logger_name in ["urllib3", "requests"]:
-            logging.getLogger(logger_name).setLevel(logging.WARNING)
-
-    return logger
-
-
-def validate_config(config: SpeedTestConfig) -> bool:
-    """
-    Validate the speed test configuration.
-
-    Args:
-        config (SpeedTestConfig): Configuration to validate
+        for library_logger in _NOISY_LOGGERS:
+            library_logger.setLevel(logging.WARNING)
 
-    Returns:
-        bool: True if configuration is valid, False otherwise
-    """
-    # Additional validation beyond what Pydantic provides
-    if config.download_size_mb > 100:
-        logging.warning(
-            f"Large download size ({config.download_size_mb} MB) may cause timeouts"
-        )
-
-    if config.upload_size_mb > 50:
-        logging.warning(
-            f"Large upload size ({config.upload_size_mb} MB) may cause timeouts"
-        )
-
-    if config.timeout_seconds < 5:
-        logging.warning("Timeout is very short and may cause tests to fail prematurely")
-
-    # All basic validation is handled by Pydantic, so we just return True
-    return True
+    return _logger
 
 
 def format_text_output(result: SpeedTestResult) -> str:
@@ -74,58 +89,69 @@ def format_text_output(result: SpeedTestResult) -> str:
     Returns:
         str: Formatted output string
     """
-    output = []
-    output.append("=== INTERNET SPEED TEST RESULTS ===")
-    output.append(f"Timestamp: {result.formatted_timestamp}")
-    output.append("")
-
-    if result.ping:
-        output.append("PING (LATENCY)")
-        output.append(f"  Min: {result.ping.min_ms:.2f} ms")
-        output.append(f"  Avg: {result.ping.avg_ms:.2f} ms")
-        output.append(f"  Max: {result.ping.max_ms:.2f} ms")
-        output.append(
-            f"  Samples: {result.ping.samples}/{result.ping.samples + result.ping.failed}"
+    header = (
+        "=== INTERNET SPEED TEST RESULTS ===\n"
+        f"Timestamp: {result.formatted_timestamp}"
+    )
+    ping_block = jitter_block = download_block = upload_block = errors_block = None
+
+    ping = result.ping
+    if ping:
+        ping_block = (
+            "PING (LATENCY)\n"
+            f"  Min: {ping.min_ms:.2f} ms\n"
+            f"  Avg: {ping.avg_ms:.2f} ms\n"
+            f"  Max: {ping.max_ms:.2f} ms\n"
+            f"  Samples: {ping.samples}/{ping.samples + ping.failed}\n"
+            f"  Success Rate: {ping.success_rate_percent:.1f}%"
         )
-        output.append(f"  Success Rate: {result.ping.success_rate_percent:.1f}%")
-        output.append("")
-
-    if result.jitter:
-        output.append("JITTER (STABILITY)")
-        output.append(f"  Avg Jitter: {result.jitter.avg_jitter_ms:.2f} ms")
-        output.append(f"  Min Jitter: {result.jitter.min_jitter_ms:.2f} ms")
-        output.append(f"  Max Jitter: {result.jitter.max_jitter_ms:.2f} ms")
-        output.append(f"  Std Dev: {result.jitter.std_dev_ms:.2f} ms")
-        output.append(
-            f"  Samples: {result.jitter.samples}/{result.jitter.samples + result.jitter.failed}"
+
+    jitter = result.jitter
+    if jitter:
+        jitter_block = (
+            "JITTER (STABILITY)\n"
+            f"  Avg Jitter: {jitter.avg_jitter_ms:.2f} ms\n"
+            f"  Min Jitter: {jitter.min_jitter_ms:.2f} ms\n"
+            f"  Max Jitter: {jitter.max_jitter_ms:.2f} ms\n"
+            f"  Std Dev: {jitter.std_dev_ms:.2f} ms\n"
+            f"  Samples: {jitter.samples}/{jitter.samples + jitter.failed}\n"
+            f"  Success Rate: {jitter.success_rate_percent:.1f}%"
         )
-        output.append(f"  Success Rate: {result.jitter.success_rate_percent:.1f}%")
-        output.append("")
-
-    if result.download:
-        output.append("DOWNLOAD")
-        output.append(f"  Speed: {result.download.speed_mbps:.2f} Mbps")
-        output.append(
-            f"  Transferred: {result.download.bytes_transferred / (1024 * 1024):.2f} MB"
+
+    download = result.download
+    if download:
+        download_block = (
+            "DOWNLOAD\n"
+            f"  Speed: {download.speed_mbps:.2f} Mbps\n"
+            f"  Transferred: {download.bytes_transferred * _PER_MB:.2f} MB\n"
+            f"  Time: {download.time_seconds:.2f} seconds"
         )
-        output.append(f"  Time: {result.download.time_seconds:.2f} seconds")
-        output.append("")
-
-    if result.upload:
-        output.append("UPLOAD")
-        output.append(f"  Speed: {result.upload.speed_mbps:.2f} Mbps")
-        output.append(
-            f"  Transferred: {result.upload.bytes_transferred / (1024 * 1024):.2f} MB"
+
+    upload = result.upload
+    if upload:
+        upload_block = (
+            "UPLOAD\n"
+            f"  Speed: {upload.speed_mbps:.2f} Mbps\n"
+            f"  Transferred: {upload.bytes_transferred * _PER_MB:.2f} MB\n"
+            f"  Time: {upload.time_seconds:.2f} seconds"
         )
-        output.append(f"  Time: {result.upload.time_seconds:.2f} seconds")
-        output.append("")
 
-    if result.errors:
-        output.append("ERRORS")
-        for error in result.errors:
-            output.append(f"  - {error}")
+    errors = result.errors
+    if errors:
+        errors_block = "ERRORS\n" + "\n".join([f"  - {e}" for e in errors])
+
+    sections = (
+        header,
+        ping_block,
+        jitter_block,
+        download_block,
+        upload_block,
+        errors_block,
+    )
+    output = "\n\n".join([section for section in sections if section is not None])
 
-    return "\n".join(output)
+    # Every section but the error list is followed by a blank line
+    return output if errors_block is not None else output + "\n"
 
 
 def format_json_output(result: SpeedTestResult) -> str:
@@ -138,101 +164,122 @@ def format_json_output(result: SpeedTestResult) -> str:
     Returns:
         str: JSON-formatted string
     """
-    return json.dumps(result.to_dict(), indent=2)
+    # Floats are rounded while the dict is built, avoiding a second walk
+    return _json_dumps(result.as_dict(ndigits=2))
 
 
-def format_csv_output(result: SpeedTestResult) -> str:
+def _quote_csv_field(field: str) -> str:
     """
-    Format test results as CSV.
+    Quote a CSV field the way csv.writer does with minimal quoting.
 
     Args:
-        result (SpeedTestResult): Speed test results to format
+        field (str): Field value to quote
 
     Returns:
-        str: CSV-formatted string
+        str: Field value, quoted only if it contains special characters
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
+    if _needs_quote(field) is None:
+        return field
 
-    # Basic information
-    writer.writerow(["Timestamp", result.formatted_timestamp])
+    return '"' + field.replace('"', '""') + '"'
+
+
+def iter_csv_output(result: SpeedTestResult) -> Iterator[str]:
+    """
+    Yield test results as CSV rows, one at a time.
+
+    Rows are yielded without a line terminator so callers writing to a file
+    can stream them without building the whole document in memory.
+
+    Args:
+        result (SpeedTestResult): Speed test results to format
+
+    Yields:
+        str: CSV row without the trailing CRLF
+    """
+    # Labels and numbers never need quoting, so rows are assembled directly;
+    # only error messages are free-form and go through _quote_csv_field
+    yield f"Timestamp,{result.formatted_timestamp}"
 
     # Write sections for each test type
-    if result.ping:
-        writer.writerow([])
-        writer.writerow(
-            ["PING (ms)", "Min", "Avg", "Max", "Samples", "Failed", "Success Rate (%)"]
-        )
-        writer.writerow(
-            [
-                "",
-                f"{result.ping.min_ms:.2f}",
-                f"{result.ping.avg_ms:.2f}",
-                f"{result.ping.max_ms:.2f}",
-                result.ping.samples,
-                result.ping.failed,
-                f"{result.ping.success_rate_percent:.1f}",
-            ]
+    ping = result.ping
+    if ping:
+        yield ""
+        yield _CSV_PING_HEADER
+        yield (
+            f",{ping.min_ms:.2f}"
+            f",{ping.avg_ms:.2f}"
+            f",{ping.max_ms:.2f}"
+            f",{ping.samples}"
+            f",{ping.failed}"
+            f",{ping.success_rate_percent:.1f}"
         )
 
-    if result.jitter:
-        writer.writerow([])
-        writer.writerow(
-            [
-                "JITTER (ms)",
-                "Avg",
-                "Min",
-                "Max",
-                "Std Dev",
-                "Samples",
-                "Failed",
-                "Success Rate (%)",
-            ]
-        )
-        writer.writerow(
-            [
-                "",
-                f"{result.jitter.avg_jitter_ms:.2f}",
-                f"{result.jitter.min_jitter_ms:.2f}",
-                f"{result.jitter.max_jitter_ms:.2f}",
-                f"{result.jitter.std_dev_ms:.2f}",
-                result.jitter.samples,
-                result.jitter.failed,
-                f"{result.jitter.success_rate_percent:.1f}",
-            ]
+    jitter = result.jitter
+    if jitter:
+        yield ""
+        yield _CSV_JITTER_HEADER
+        yield (
+            f",{jitter.avg_jitter_ms:.2f}"
+            f",{jitter.min_jitter_ms:.2f}"
+            f",{jitter.max_jitter_ms:.2f}"
+            f",{jitter.std_dev_ms:.2f}"
+            f",{jitter.samples}"
+            f",{jitter.failed}"
+            f",{jitter.success_rate_percent:.1f}"
         )
 
-    if result.download:
-        writer.writerow([])
-        writer.writerow(["DOWNLOAD", "Speed (Mbps)", "Transferred (MB)", "Time (s)"])
-        writer.writerow(
-            [
-                "",
-                f"{result.download.speed_mbps:.2f}",
-                f"{result.download.bytes_transferred / (1024 * 1024):.2f}",
-                f"{result.download.time_seconds:.2f}",
-            ]
+    download = result.download
+    if download:
+        yield ""
+        yield _CSV_DOWNLOAD_HEADER
+        yield (
+            f",{download.speed_mbps:.2f}"
+            f",{download.bytes_transferred * _PER_MB:.2f}"
+            f",{download.time_seconds:.2f}"
         )
 
-    if result.upload:
-        writer.writerow([])
-        writer.writerow(["UPLOAD", "Speed (Mbps)", "Transferred (MB)", "Time (s)"])
-        writer.writerow(
-            [
-                "",
-                f"{result.upload.speed_mbps:.2f}",
-                f"{result.upload.bytes_transferred / (1024 * 1024):.2f}",
-                f"{result.upload.time_seconds:.2f}",
-            ]
+    upload = result.upload
+    if upload:
+        yield ""
+        yield _CSV_UPLOAD_HEADER
+        yield (
+            f",{upload.speed_mbps:.2f}"
+            f",{upload.bytes_transferred * _PER_MB:.2f}"
+            f",{upload.time_seconds:.2f}"
         )
 
-    if result.errors:
-        writer.writerow([])
-        writer.writerow(["ERRORS"])
-        for error in result.errors:
-            writer.writerow(["", error])
+    errors = result.errors
+    if errors:
+        yield ""
+        yield _CSV_ERRORS_HEADER
+        for error in errors:
+            yield f",{_quote_csv_field(error)}"
+
+
+def format_csv_output(result: SpeedTestResult) -> str:
+    """
+    Format test results as CSV.
+
+    Args:
+        result (SpeedTestResult): Speed test results to format
 
-    return output.getvalue()
+    Returns:
+        str: CSV-formatted string
+    """
+    # Materialize the rows so join works on a list rather than a generator.
+    # The empty last row keeps the CRLF csv.writer put after every row.
+    rows = list(iter_csv_output(result))
+    rows.append("")
+    return "\r\n".join(rows)
+
+
+# Formatters keyed by lowercase output format name
+_FORMATTERS = {
+    "text": format_text_output,
+    "json": format_json_output,
+    "csv": format_csv_output,
+}
 
 
 def format_output(result: SpeedTestResult, output_format: str = "text") -> str:
@@ -246,9 +293,62 @@ def format_output(result: SpeedTestResult, output_format: str = "text") -> str:
     Returns:
         str: Formatted output string
     """
-    if output_format.lower() == "json":
-        return format_json_output(result)
-    elif output_format.lower() == "csv":
-        return format_csv_output(result)
+    # The CLI already passes lowercase names; only other spellings are lowered
+    formatter = _FORMATTERS.get(output_format)
+    if formatter is None:
+        formatter = _FORMATTERS.get(output_format.lower(), format_text_output)
+
+    return formatter(result)
+
+
+def write_output(
+    result: SpeedTestResult,
+    stream: TextIO,
+    output_format: str = "text",
+    buffer_size: int = 64 * 1024,
+) -> None:
+    """
+    Write formatted test results to a stream, followed by a newline.
+
+    When the stream exposes an underlying binary buffer (as sys.stdout does),
+    output is encoded and written there in blocks of at least buffer_size
+    bytes instead of many small writes; 64 KB is where buffered write
+    throughput levels off. CSV output is streamed row by row into that block.
+    On platforms whose line separator isn't "\n" (Windows), text streams
+    translate newlines, so output goes through the text layer instead.
+
+    Args:
+        result (SpeedTestResult): Speed test results to write
+        stream (TextIO): Text stream to write to
+        output_format (str): Desired output format (text, json, csv)
+        buffer_size (int): Number of bytes to accumulate before each write
+    """
+    # The binary buffer bypasses newline translation; only use it where the
+    # text layer wouldn't translate anything, so the bytes written are the same
+    binary = getattr(stream, "buffer", None) if os.linesep == "\n" else None
+    if binary is None:
+        stream.write(format_output(result, output_format) + "\n")
+        return
+
+    encoding = getattr(stream, "encoding", None) or "utf-8"
+    errors = getattr(stream, "errors", None) or "strict"
+
+    # Flush pending text so it stays ahead of the bytes written below
+    stream.flush()
+
+    if output_format.lower() == "csv":
+        buffer = bytearray()
+        for row in iter_csv_output(result):
+            buffer += row.encode(encoding, errors)
+            buffer += b"\r\n"
+            if len(buffer) >= buffer_size:
+                binary.write(buffer)
+                buffer.clear()
+
+        buffer += b"\n"
+        binary.write(buffer)
     else:
-        return format_text_output(result)
+        output = format_output(result, output_format) + "\n"
+        binary.write(output.encode(encoding, errors))
+
+    binary.flush()